@@ -1,12 +1,13 @@
 import yaml
 import argparse
+import functools
 import sys
 
-from . import sync as _sync
-from . import auth as _auth
-from . import backup as _backup
+# use libyaml's C parser when available, falling back to the pure-Python one
+Loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
 
-def main():
+@functools.cache
+def _make_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(
         description='Sync Spotify playlists and favorites to Tidal',
         epilog='Examples:\n'
@@ -21,8 +22,12 @@ def main():
     parser.add_argument('--sync-albums', action=argparse.BooleanOptionalAction, help='synchronize saved albums')
     parser.add_argument('--sync-artists', action=argparse.BooleanOptionalAction, help='synchronize followed artists')
     parser.add_argument('--export', metavar='FILE', help='export Spotify data to a local JSON file (no Tidal login required)')
+    parser.add_argument('--pretty', action='store_true', help='indent the exported JSON backup for readability')
     parser.add_argument('--import', dest='import_file', metavar='FILE', help='import from a local backup file to Tidal (no Spotify login required)')
-    args = parser.parse_args()
+    return parser
+
+def main():
+    args = _make_parser().parse_args()
 
     # Validate mutually exclusive options
     if args.export and args.import_file:
@@ -33,10 +38,13 @@ def main():
         sys.exit("Error: --import and --uri cannot be used together")
 
     with open(args.config, 'r') as f:
-        config = yaml.safe_load(f)
+        config = yaml.load(f, Loader=Loader)
 
+    # the sync modules pull in spotipy and tidalapi, so only import them once they are needed
     # Handle export mode (Spotify only)
     if args.export:
+        from . import auth as _auth
+        from . import backup as _backup
         print("Opening Spotify session")
         spotify_session = _auth.open_spotify_session(config['spotify'])
         include_favorites = args.sync_favorites is None or args.sync_favorites
@@ -44,12 +52,16 @@ def main():
         include_artists = args.sync_artists is None or args.sync_artists
         _backup.export_wrapper(
             spotify_session, config, args.export,
-            include_favorites, include_albums, include_artists
+            include_favorites, include_albums, include_artists, args.pretty
         )
         return
 
     # Handle import mode (Tidal only)
     if args.import_file:
+        from . import auth as _auth
+        from . import backup as _backup
+        from . import sync as _sync
+        _sync.configure_tidal_pool(config)
         print("Opening Tidal session")
         tidal_session = _auth.open_tidal_session()
         if not tidal_session.check_login():
@@ -64,6 +76,9 @@ def main():
         return
 
     # Standard sync mode (both Spotify and Tidal)
+    from . import auth as _auth
+    from . import sync as _sync
+    _sync.configure_tidal_pool(config)
     print("Opening Spotify session")
     spotify_session = _auth.open_spotify_session(config['spotify'])
     print("Opening Tidal session")
@@ -8,11 +8,31 @@ This enables a two-step migration process:
 """
 
 import asyncio
+import contextlib
+from contextvars import ContextVar
+import io
 import json
+import itertools
+from collections import deque
+import mmap
+import os
+import sys
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, List, Sequence
-
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Sequence
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+try:
+    import ijson
+except ImportError:
+    ijson = None
 import spotipy
 import tidalapi
 
@@ -22,10 +42,13 @@ from .sync import (
     pick_tidal_playlist_for_spotify_playlist,
     populate_track_match_cache,
     search_new_tracks_on_tidal,
+    search_tidal_concurrently,
+    tidal_rate_limiter,
     get_tracks_for_new_tidal_playlist,
     get_all_playlist_tracks,
     repeat_on_request_error,
     _fetch_all_from_spotify_in_chunks,
+    _tidal_call,
     get_albums_from_spotify,
     get_artists_from_spotify,
     simple,
@@ -38,7 +61,7 @@ from .tidalapi_patch import (
     get_all_favorites,
     get_all_playlists,
 )
-from .cache import track_match_cache
+from .cache import favorite_ids_cache, playlist_snapshot_cache, track_match_cache
 from .type import spotify as t_spotify
 from tqdm import tqdm
 
@@ -46,19 +69,71 @@ from tqdm import tqdm
 # Current backup format version
 BACKUP_VERSION = 2
 
+# Number of track ids sent per request when adding Tidal favorites
+FAVORITES_CHUNK_SIZE = 50
+
+
+# Backups with this suffix are written as newline delimited JSON, one record per line
+NDJSON_SUFFIX = '.ndjson'
+
+# Backups with this suffix are written as MessagePack, which requires the optional msgpack package
+MSGPACK_SUFFIX = '.msgpack'
+
+# Maps the backup list fields to the record type used for their items in NDJSON backups
+_NDJSON_RECORD_TYPES = {
+    'playlists': 'playlist',
+    'favorites': 'favorite',
+    'albums': 'album',
+    'artists': 'artist',
+}
+
+# Marks the start of a top level list in the events of a streamed JSON backup
+_LIST_START = object()
+
+
+def _dumps(data: Any, indent: bool = True) -> bytes:
+    """Serialize backup data to UTF-8 JSON, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 if indent else 0)
+    if indent:
+        return json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
+    return json.dumps(data, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+
+def _loads(raw: bytes) -> Any:
+    """Parse UTF-8 JSON bytes, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
 
-def _simplify_track(track: dict) -> dict:
+
+def _load_json_file(path: str) -> Any:
+    """Parse a JSON file, handing orjson a memory map of it so large backups aren't copied into a bytes object first."""
+    if orjson is None or os.path.getsize(path) == 0:
+        return _loads(Path(path).read_bytes())
+    with open(path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        with memoryview(mm) as view:
+            return orjson.loads(view)
+
+
+# Shared read-only default for missing nested dicts, avoids allocating a new one on every lookup
+_EMPTY: Dict[str, Any] = {}
+
+
+def _simplify_track(track: dict, _get=dict.get) -> dict:
     """Extract only the fields needed for Tidal matching from a Spotify track."""
+    # called once per exported track, so bind dict.get locally and avoid throwaway defaults
+    album = _get(track, 'album') or _EMPTY
     return {
-        'id': track.get('id'),
-        'name': track.get('name'),
-        'duration_ms': track.get('duration_ms'),
-        'track_number': track.get('track_number'),
-        'external_ids': track.get('external_ids', {}),
-        'artists': [{'name': a.get('name')} for a in track.get('artists', [])],
+        'id': _get(track, 'id'),
+        'name': _get(track, 'name'),
+        'duration_ms': _get(track, 'duration_ms'),
+        'track_number': _get(track, 'track_number'),
+        'external_ids': _get(track, 'external_ids') or {},
+        'artists': [{'name': _get(a, 'name')} for a in _get(track, 'artists') or ()],
         'album': {
-            'name': track.get('album', {}).get('name'),
-            'artists': [{'name': a.get('name')} for a in track.get('album', {}).get('artists', [])],
+            'name': _get(album, 'name'),
+            'artists': [{'name': _get(a, 'name')} for a in _get(album, 'artists') or ()],
         }
     }
 
@@ -90,12 +165,263 @@ def _simplify_artist(artist: dict) -> dict:
     }
 
 
+class _BackupWriter:
+    """
+    Incrementally writes a backup file as a single JSON object, compact or indented by two spaces.
+    Lists can be written one item at a time, so the whole backup never needs to be held in memory.
+    The output is identical to serializing the complete backup dict in one go.
+    """
+
+    def __init__(self, f, indent: bool = False):
+        self._f = f
+        self._indent = indent
+        self._field_count = 0
+        self._item_count = 0
+
+    def _write_key(self, key: str):
+        self._f.write(b'{' if self._field_count == 0 else b',')
+        if self._indent:
+            self._f.write(b'\n  ' + _dumps(key) + b': ')
+        else:
+            self._f.write(_dumps(key, indent=False) + b':')
+        self._field_count += 1
+
+    def write_field(self, key: str, value: Any):
+        """ writes a complete top level field """
+        self._write_key(key)
+        if self._indent:
+            self._f.write(_dumps(value).replace(b'\n', b'\n  '))
+        else:
+            self._f.write(_dumps(value, indent=False))
+
+    def begin_list(self, key: str):
+        """ starts a top level list field, whose items are then written with append() """
+        self._write_key(key)
+        self._f.write(b'[')
+        self._item_count = 0
+
+    def append(self, item: Any):
+        if self._indent:
+            self._f.write(b'\n    ' if self._item_count == 0 else b',\n    ')
+            self._f.write(_dumps(item).replace(b'\n', b'\n    '))
+        else:
+            if self._item_count:
+                self._f.write(b',')
+            self._f.write(_dumps(item, indent=False))
+        self._item_count += 1
+
+    def extend(self, items: Iterable[Any]):
+        for item in items:
+            self.append(item)
+
+    def end_list(self):
+        self._f.write(b'\n  ]' if self._indent and self._item_count else b']')
+
+    def close(self):
+        self._f.write(b'\n}' if self._indent else b'}')
+
+
+class _NdjsonBackupWriter(_BackupWriter):
+    """
+    Incrementally writes a backup file as newline delimited JSON.
+    The first line is a header record with the top level fields, followed by one line per
+    playlist, favorite, album and artist, so the backup can also be read back one record at a time.
+    """
+
+    def __init__(self, f):
+        super().__init__(f)
+        self._header: Dict[str, Any] | None = {'type': 'header'}
+        self._record_type = None
+
+    def _write_header(self):
+        if self._header is not None:
+            self._f.write(_dumps(self._header, indent=False) + b'\n')
+            self._header = None
+
+    def write_field(self, key: str, value: Any):
+        self._header[key] = value
+
+    def begin_list(self, key: str):
+        self._write_header()
+        self._record_type = _NDJSON_RECORD_TYPES[key]
+
+    def append(self, item: Any):
+        self._f.write(_dumps({'type': self._record_type, **item}, indent=False) + b'\n')
+
+    def end_list(self):
+        self._record_type = None
+
+    def close(self):
+        self._write_header()
+
+
+class _MsgpackBackupWriter(_BackupWriter):
+    """
+    Writes a backup file as a single MessagePack map, which is smaller and faster to parse than JSON.
+    The backup is collected in memory and packed on close.
+    """
+
+    def __init__(self, f):
+        super().__init__(f)
+        self._data: Dict[str, Any] = {}
+        self._list: List[Any] | None = None
+
+    def write_field(self, key: str, value: Any):
+        self._data[key] = value
+
+    def begin_list(self, key: str):
+        self._list = self._data[key] = []
+
+    def append(self, item: Any):
+        self._list.append(item)
+
+    def end_list(self):
+        self._list = None
+
+    def close(self):
+        self._f.write(msgpack.packb(self._data, use_bin_type=True))
+
+
+def _is_ndjson(backup_path: str) -> bool:
+    return str(backup_path).endswith(NDJSON_SUFFIX)
+
+
+def _is_msgpack(backup_path: str) -> bool:
+    return str(backup_path).endswith(MSGPACK_SUFFIX)
+
+
+def _require_msgpack(backup_path: str):
+    if _is_msgpack(backup_path) and msgpack is None:
+        raise ValueError(f"Reading or writing '{backup_path}' requires the msgpack package (pip install msgpack)")
+
+
+def _make_backup_writer(f, output_path: str, pretty: bool = False) -> _BackupWriter:
+    """ picks the backup writer matching the output file's suffix, pretty only applies to JSON backups """
+    if _is_ndjson(output_path):
+        return _NdjsonBackupWriter(f)
+    if _is_msgpack(output_path):
+        return _MsgpackBackupWriter(f)
+    return _BackupWriter(f, indent=pretty)
+
+
+def _iter_ndjson_records(backup_path: str) -> Iterator[dict]:
+    """ yields the records of an NDJSON backup one line at a time """
+    with open(backup_path, 'rb') as f:
+        for line in f:
+            if line.strip():
+                yield _loads(line)
+
+
+def _split_backup_items(header: dict, items: Iterator[tuple[str, Any]]) -> tuple[dict, Iterator[dict]]:
+    """
+    Split a stream of (list field, item) pairs into an iterator over the playlists and the other lists,
+    which are added to the header and filled in as the iterator is consumed.
+    """
+    lists = {key: [] for key in _NDJSON_RECORD_TYPES if key != 'playlists'}
+
+    def _iter_playlists():
+        for key, item in items:
+            if key == 'playlists':
+                yield item
+            elif key in lists:
+                lists[key].append(item)
+
+    header.update(lists)
+    return header, _iter_playlists()
+
+
+def _stream_ndjson_backup(backup_path: str) -> tuple[dict, Iterator[dict]]:
+    """
+    Open an NDJSON backup for streaming.
+
+    Returns:
+        The validated header fields, and an iterator over the playlists. The header also contains
+        'favorites', 'albums' and 'artists' lists, which are filled in as the iterator is consumed.
+    """
+    records = _iter_ndjson_records(backup_path)
+    header = next(records, {})
+    if header.pop('type', None) != 'header':
+        raise ValueError("Invalid backup file: missing header record")
+    _check_backup_version(header)
+    list_keys = {record_type: key for key, record_type in _NDJSON_RECORD_TYPES.items()}
+    return _split_backup_items(header, ((list_keys.get(record.pop('type', None)), record) for record in records))
+
+
+def _iter_json_backup_events(backup_path: str) -> Iterator[tuple[str, Any]]:
+    """
+    Parse a JSON backup incrementally with ijson.
+    Yields (field, value) for top level scalar fields, (list field, _LIST_START) where each top level
+    list starts and (list field, item) for each item of the top level lists.
+    """
+    item_prefixes = {f'{key}.item': key for key in _NDJSON_RECORD_TYPES}
+    builder = None
+    item_prefix = None
+    with open(backup_path, 'rb') as f:
+        for prefix, event, value in ijson.parse(f, use_float=True):
+            if builder is not None:
+                builder.event(event, value)
+                if prefix == item_prefix and event in ('end_map', 'end_array'):
+                    yield item_prefixes[item_prefix], builder.value
+                    builder = None
+            elif prefix in item_prefixes:
+                if event in ('start_map', 'start_array'):
+                    builder = ijson.ObjectBuilder()
+                    builder.event(event, value)
+                    item_prefix = prefix
+                elif event != 'end_array':
+                    yield item_prefixes[prefix], value
+            elif prefix in _NDJSON_RECORD_TYPES and event == 'start_array':
+                yield prefix, _LIST_START
+            elif prefix and '.' not in prefix and event in ('null', 'boolean', 'number', 'string'):
+                yield prefix, value
+
+
+def _stream_json_backup(backup_path: str) -> tuple[dict, Iterator[dict]]:
+    """
+    Open a JSON backup for streaming, using the optional ijson package.
+    Returns the same structure as _stream_ndjson_backup. Backups written by this tool have their
+    version before the playlists, so they are validated up front. Other backups are loaded
+    completely, so that they are validated exactly like load_backup does.
+    """
+    events = _iter_json_backup_events(backup_path)
+    header = {}
+    first_list = None
+    for key, value in events:
+        if key in _NDJSON_RECORD_TYPES:
+            first_list = key
+            break
+        header[key] = value
+
+    if 'version' not in header or first_list != 'playlists':
+        events.close()
+        data = _load_json_file(backup_path)
+        _check_backup_version(data)
+        if 'playlists' not in data:
+            raise ValueError("Invalid backup file: missing playlists field")
+        return data, iter(data.pop('playlists'))
+    _check_backup_version(header)
+
+    def _iter_items():
+        for key, value in events:
+            if key not in _NDJSON_RECORD_TYPES:
+                header[key] = value
+            elif value is not _LIST_START:
+                yield key, value
+
+    return _split_backup_items(header, _iter_items())
+
+
+def _read_ndjson_backup(backup_path: str) -> dict:
+    """ reads a complete NDJSON backup into the same structure as a JSON backup """
+    data, playlists = _stream_ndjson_backup(backup_path)
+    data['playlists'] = list(playlists)
+    return data
+
+
 async def _get_spotify_favorites(spotify_session: spotipy.Spotify) -> List[dict]:
-    """Fetch all favorite tracks from Spotify."""
+    """Fetch all favorite tracks from Spotify, most recently saved first."""
     _get_favorite_tracks = lambda offset: spotify_session.current_user_saved_tracks(offset=offset)
-    tracks = await repeat_on_request_error(_fetch_all_from_spotify_in_chunks, _get_favorite_tracks)
-    tracks.reverse()
-    return tracks
+    return await repeat_on_request_error(_fetch_all_from_spotify_in_chunks, _get_favorite_tracks)
 
 
 async def export_spotify_data(
@@ -105,6 +431,7 @@ async def export_spotify_data(
     include_favorites: bool = True,
     include_albums: bool = True,
     include_artists: bool = True,
+    pretty: bool = False,
 ) -> None:
     """
     Export all Spotify playlists, favorites, albums, and artists to a local JSON file.
@@ -116,7 +443,9 @@ async def export_spotify_data(
         include_favorites: Whether to include liked songs in the backup
         include_albums: Whether to include saved albums in the backup
         include_artists: Whether to include followed artists in the backup
+        pretty: Whether to indent JSON backups for readability instead of writing them compactly
     """
+    _require_msgpack(output_path)
     print("Starting Spotify data export...")
 
     # Get user info
@@ -128,71 +457,171 @@ async def export_spotify_data(
     playlists = await get_playlists_from_spotify(spotify_session, config)
     print(f"Found {len(playlists)} playlists")
 
-    # Fetch tracks for each playlist
-    exported_playlists = []
-    for playlist in tqdm(playlists, desc="Exporting playlists"):
-        tracks = await get_tracks_from_spotify_playlist(spotify_session, playlist)
-        exported_playlists.append(_simplify_playlist(playlist, tracks))
-
-    # Fetch favorites if requested
-    exported_favorites = []
-    if include_favorites:
-        print("Fetching favorite tracks from Spotify...")
-        favorites = await _get_spotify_favorites(spotify_session)
-        exported_favorites = [_simplify_track(t) for t in favorites]
-        print(f"Found {len(exported_favorites)} favorite tracks")
-
-    # Fetch albums if requested
-    exported_albums = []
-    if include_albums:
-        print("Fetching saved albums from Spotify...")
-        albums = await get_albums_from_spotify(spotify_session)
-        exported_albums = [_simplify_album(a) for a in albums]
-        print(f"Found {len(exported_albums)} saved albums")
-
-    # Fetch artists if requested
-    exported_artists = []
-    if include_artists:
-        print("Fetching followed artists from Spotify...")
-        artists = await get_artists_from_spotify(spotify_session)
-        exported_artists = [_simplify_artist(a) for a in artists]
-        print(f"Found {len(exported_artists)} followed artists")
-
-    # Build the backup structure
-    backup_data = {
-        'version': BACKUP_VERSION,
-        'exported_at': datetime.now(timezone.utc).isoformat(),
-        'spotify_user': username,
-        'playlists': exported_playlists,
-        'favorites': exported_favorites,
-        'albums': exported_albums,
-        'artists': exported_artists,
-    }
-
-    # Calculate totals
-    total_playlist_tracks = sum(len(p['tracks']) for p in exported_playlists)
-    total_tracks = total_playlist_tracks + len(exported_favorites)
-
-    # Write to file
+    # Fetch tracks for several playlists concurrently
+    spotify_concurrency = config.get('spotify_concurrency', 8)
+    semaphore = asyncio.Semaphore(spotify_concurrency)
+
+    async def _export_playlist(playlist: dict) -> dict:
+        # Playlists which haven't changed since the last export are taken from the snapshot cache
+        snapshot_id = playlist.get('snapshot_id')
+        snapshot_key = f"{BACKUP_VERSION}:{snapshot_id}"
+        if snapshot_id:
+            cached_tracks = await asyncio.to_thread(playlist_snapshot_cache.get, playlist['id'], snapshot_key)
+            if cached_tracks is not None:
+                return {**_simplify_playlist(playlist, []), 'tracks': _loads(cached_tracks)}
+        async with semaphore:
+            tracks = await get_tracks_from_spotify_playlist(spotify_session, playlist)
+        exported_playlist = _simplify_playlist(playlist, tracks)
+        if snapshot_id:
+            await asyncio.to_thread(
+                playlist_snapshot_cache.set, playlist['id'], snapshot_key, _dumps(exported_playlist['tracks'], indent=False)
+            )
+        return exported_playlist
+
+    # Write to a temporary file which replaces the output once it is complete,
+    # so that an interrupted export never leaves behind a truncated backup
     output_file = Path(output_path)
-    with open(output_file, 'w', encoding='utf-8') as f:
-        json.dump(backup_data, f, indent=2, ensure_ascii=False)
+    temp_file = output_file.with_name(output_file.name + '.tmp')
+    try:
+        with open(temp_file, 'wb') as f:
+            writer = _make_backup_writer(f, output_path, pretty)
+            writer.write_field('version', BACKUP_VERSION)
+            writer.write_field('exported_at', datetime.now(timezone.utc).isoformat())
+            writer.write_field('spotify_user', username)
+
+            # Start fetching favorites, albums and artists now, so that they overlap with the playlist fetches
+            tasks = []
+            if include_favorites:
+                print("Fetching favorite tracks from Spotify...")
+                favorites_task = asyncio.create_task(_get_spotify_favorites(spotify_session))
+                tasks.append(favorites_task)
+            if include_albums:
+                print("Fetching saved albums from Spotify...")
+                albums_task = asyncio.create_task(get_albums_from_spotify(spotify_session))
+                tasks.append(albums_task)
+            if include_artists:
+                print("Fetching followed artists from Spotify...")
+                artists_task = asyncio.create_task(get_artists_from_spotify(spotify_session))
+                tasks.append(artists_task)
+
+            # Write each playlist as soon as it is fetched, in playlist order. At most
+            # spotify_concurrency playlists are started ahead of the one being written,
+            # so that only those are held in memory.
+            # Encoding and writing happens in a worker thread to keep the event loop free for the fetches
+            total_playlist_tracks = 0
+            remaining_playlists = iter(playlists)
+            pending = deque()
+            try:
+                for playlist in itertools.islice(remaining_playlists, spotify_concurrency):
+                    pending.append(asyncio.create_task(_export_playlist(playlist)))
+                writer.begin_list('playlists')
+                with tqdm(desc="Exporting playlists", total=len(playlists)) as progress:
+                    while pending:
+                        exported_playlist = await pending.popleft()
+                        next_playlist = next(remaining_playlists, None)
+                        if next_playlist is not None:
+                            pending.append(asyncio.create_task(_export_playlist(next_playlist)))
+                        await asyncio.to_thread(writer.append, exported_playlist)
+                        total_playlist_tracks += len(exported_playlist['tracks'])
+                        progress.update(1)
+                writer.end_list()
+
+                # Write favorites if requested
+                favorites_count = 0
+                writer.begin_list('favorites')
+                if include_favorites:
+                    favorites = await favorites_task
+                    # backups store favorites oldest first
+                    await asyncio.to_thread(writer.extend, (_simplify_track(t) for t in reversed(favorites)))
+                    favorites_count = len(favorites)
+                    del favorites
+                    print(f"Found {favorites_count} favorite tracks")
+                writer.end_list()
+
+                # Write albums if requested
+                exported_albums = []
+                if include_albums:
+                    albums = await albums_task
+                    exported_albums = [_simplify_album(a) for a in albums]
+                    print(f"Found {len(exported_albums)} saved albums")
+                await asyncio.to_thread(_write_list, writer, 'albums', exported_albums)
+
+                # Write artists if requested
+                exported_artists = []
+                if include_artists:
+                    artists = await artists_task
+                    exported_artists = [_simplify_artist(a) for a in artists]
+                    print(f"Found {len(exported_artists)} followed artists")
+                await asyncio.to_thread(_write_list, writer, 'artists', exported_artists)
+            except BaseException:
+                # Don't leave fetches running in the background once the export has failed
+                for task in (*pending, *tasks):
+                    task.cancel()
+                await asyncio.gather(*pending, *tasks, return_exceptions=True)
+                raise
+            writer.close()
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_file, output_file)
+    except BaseException:
+        temp_file.unlink(missing_ok=True)
+        raise
+    await asyncio.to_thread(playlist_snapshot_cache.prune, [playlist['id'] for playlist in playlists])
 
     print(f"\nExport complete!")
-    print(f"  Playlists: {len(exported_playlists)}")
+    print(f"  Playlists: {len(playlists)}")
     print(f"  Playlist tracks: {total_playlist_tracks}")
-    print(f"  Favorite tracks: {len(exported_favorites)}")
+    print(f"  Favorite tracks: {favorites_count}")
     print(f"  Albums: {len(exported_albums)}")
     print(f"  Artists: {len(exported_artists)}")
     print(f"  Saved to: {output_file.absolute()}")
 
 
-def load_backup(backup_path: str) -> dict:
+def _write_list(writer: _BackupWriter, key: str, items: Iterable[Any]):
+    writer.begin_list(key)
+    writer.extend(items)
+    writer.end_list()
+
+
+def dump_backup(backup_data: dict, backup_path: str, pretty: bool = False) -> None:
+    """
+    Write a complete backup dict to a file, in the format chosen by the file's suffix.
+
+    Args:
+        backup_data: Backup data in the structure returned by load_backup
+        backup_path: Path to write the backup file to
+        pretty: Whether to indent JSON backups for readability instead of writing them compactly
+    """
+    _require_msgpack(backup_path)
+    with open(backup_path, 'wb') as f:
+        writer = _make_backup_writer(f, backup_path, pretty)
+        # top level fields first, as NDJSON backups keep them in the header record
+        for key, value in backup_data.items():
+            if key not in _NDJSON_RECORD_TYPES:
+                writer.write_field(key, value)
+        for key, value in backup_data.items():
+            if key in _NDJSON_RECORD_TYPES:
+                _write_list(writer, key, value)
+        writer.close()
+
+
+def _check_backup_version(data: dict):
+    version = data.get('version')
+    if version is None:
+        raise ValueError("Invalid backup file: missing version field")
+    if version > BACKUP_VERSION:
+        raise ValueError(f"Backup version {version} is newer than supported version {BACKUP_VERSION}")
+
+
+def load_backup(backup_path: str, stream: bool = False) -> dict:
     """
     Load and validate a backup file.
 
     Args:
         backup_path: Path to the backup JSON file
+        stream: Parse the playlists incrementally where possible (NDJSON backups, or JSON backups when
+            ijson is installed). 'playlists' is then an iterator, and the 'favorites', 'albums' and
+            'artists' lists are filled in as it is consumed.
 
     Returns:
         Parsed backup data
@@ -200,15 +629,22 @@ def load_backup(backup_path: str) -> dict:
     Raises:
         ValueError: If the backup file is invalid or incompatible
     """
-    with open(backup_path, 'r', encoding='utf-8') as f:
-        data = json.load(f)
-
-    # Validate version
-    version = data.get('version')
-    if version is None:
-        raise ValueError("Invalid backup file: missing version field")
-    if version > BACKUP_VERSION:
-        raise ValueError(f"Backup version {version} is newer than supported version {BACKUP_VERSION}")
+    _require_msgpack(backup_path)
+
+    if stream and (_is_ndjson(backup_path) or (ijson is not None and not _is_msgpack(backup_path))):
+        stream_backup = _stream_ndjson_backup if _is_ndjson(backup_path) else _stream_json_backup
+        data, playlists = stream_backup(backup_path)
+        data['playlists'] = playlists
+        return data
+
+    if _is_ndjson(backup_path):
+        data = _read_ndjson_backup(backup_path)
+    elif _is_msgpack(backup_path):
+        data = msgpack.unpackb(Path(backup_path).read_bytes(), raw=False)
+        _check_backup_version(data)
+    else:
+        data = _load_json_file(backup_path)
+        _check_backup_version(data)
 
     # Validate required fields
     if 'playlists' not in data:
@@ -217,11 +653,63 @@ def load_backup(backup_path: str) -> dict:
     return data
 
 
+def load_backups(backup_paths: Sequence[str]) -> List[dict]:
+    """
+    Load and validate several backup files, in the order given.
+    The files are parsed one after another, as parsing holds the GIL even with orjson.
+    """
+    return [load_backup(path) for path in backup_paths]
+
+
+async def aload_backup(backup_path: str, stream: bool = False) -> dict:
+    """
+    Load and validate a backup file like load_backup, in a worker thread.
+    This keeps the file reads off the event loop, but parsing holds the GIL,
+    so other tasks make little progress while a complete backup is parsed.
+    """
+    return await asyncio.to_thread(load_backup, backup_path, stream)
+
+
+def _match_tracks_by_isrc(
+    spotify_tracks: Sequence[t_spotify.SpotifyTrack],
+    tidal_tracks: Sequence[tidalapi.Track],
+) -> tuple[List[t_spotify.SpotifyTrack], List[tidalapi.Track]]:
+    """
+    Cache matches between Spotify tracks and existing Tidal tracks that share an ISRC.
+
+    An ISRC match is always accepted by match(), so these pairs can be found with a hash lookup
+    instead of the pairwise comparison in populate_track_match_cache.
+
+    Returns:
+        The Spotify and Tidal tracks that were left unmatched
+    """
+    tidal_tracks_by_isrc = {}
+    for tidal_track in tidal_tracks:
+        if tidal_track.available and tidal_track.isrc:
+            tidal_tracks_by_isrc.setdefault(tidal_track.isrc, tidal_track)
+
+    matches = {}
+    unmatched_spotify_tracks = []
+    for spotify_track in spotify_tracks:
+        isrc = (spotify_track.get('external_ids') or _EMPTY).get('isrc')
+        tidal_track = tidal_tracks_by_isrc.get(isrc) if isrc and spotify_track.get('id') else None
+        if tidal_track:
+            matches[spotify_track['id']] = tidal_track.id
+        else:
+            unmatched_spotify_tracks.append(spotify_track)
+    track_match_cache.insert_many(matches)
+
+    matched_tidal_ids = set(matches.values())
+    unmatched_tidal_tracks = [t for t in tidal_tracks if t.id not in matched_tidal_ids]
+    return unmatched_spotify_tracks, unmatched_tidal_tracks
+
+
 async def sync_playlist_from_backup(
     tidal_session: tidalapi.Session,
     playlist_data: dict,
     tidal_playlist: tidalapi.Playlist | None,
     config: dict,
+    rate_limiter: asyncio.Semaphore | None = None,
 ) -> None:
     """
     Sync a single playlist from backup data to Tidal.
@@ -231,6 +719,7 @@ async def sync_playlist_from_backup(
         playlist_data: Playlist data from backup file
         tidal_playlist: Existing Tidal playlist or None to create new
         config: Configuration dictionary
+        rate_limiter: Rate limiter shared with other playlists being synced, see tidal_rate_limiter
     """
     spotify_tracks: List[t_spotify.SpotifyTrack] = playlist_data['tracks']
     playlist_name = playlist_data['name']
@@ -249,8 +738,9 @@ async def sync_playlist_from_backup(
         old_tidal_tracks = []
 
     # Match and search for tracks
-    populate_track_match_cache(spotify_tracks, old_tidal_tracks)
-    await search_new_tracks_on_tidal(tidal_session, spotify_tracks, playlist_name, config)
+    unmatched_spotify_tracks, unmatched_tidal_tracks = _match_tracks_by_isrc(spotify_tracks, old_tidal_tracks)
+    populate_track_match_cache(unmatched_spotify_tracks, unmatched_tidal_tracks)
+    await search_new_tracks_on_tidal(tidal_session, spotify_tracks, playlist_name, config, rate_limiter)
     new_tidal_track_ids = get_tracks_for_new_tidal_playlist(spotify_tracks)
 
     # Update the Tidal playlist
@@ -289,29 +779,56 @@ async def sync_favorites_from_backup(
     old_tidal_tracks = await get_all_favorites(tidal_session.user.favorites, order='DATE')
 
     # Match and search for tracks
-    populate_track_match_cache(spotify_tracks, old_tidal_tracks)
+    unmatched_spotify_tracks, unmatched_tidal_tracks = _match_tracks_by_isrc(spotify_tracks, old_tidal_tracks)
+    populate_track_match_cache(unmatched_spotify_tracks, unmatched_tidal_tracks)
     await search_new_tracks_on_tidal(tidal_session, spotify_tracks, "Favorites", config)
 
-    # Add new favorites to Tidal
-    existing_favorite_ids = set([track.id for track in old_tidal_tracks])
-    new_ids = []
+    # Add new favorites to Tidal, in backup order
+    existing_favorite_ids = {track.id for track in old_tidal_tracks}
+    cache_get = track_match_cache.get
+    tracks_to_add = {}
     for spotify_track in spotify_tracks:
-        if not spotify_track.get('id'):
-            continue
-        match_id = track_match_cache.get(spotify_track['id'])
-        if match_id and match_id not in existing_favorite_ids:
-            new_ids.append(match_id)
-
-    if new_ids:
-        for tidal_id in tqdm(new_ids, desc="Adding new tracks to Tidal favorites"):
-            tidal_session.user.favorites.add_track(tidal_id)
+        match_id = cache_get(spotify_track.get('id'))
+        if match_id and match_id not in existing_favorite_ids and match_id not in tracks_to_add:
+            artist_names = ', '.join(artist['name'] for artist in spotify_track['artists'])
+            tracks_to_add[match_id] = f"{artist_names} - {spotify_track['name']}"
+
+    if tracks_to_add:
+        await _add_favorites_in_order(tidal_session.user.favorites.add_track, tracks_to_add, 'track')
     else:
         print("No new tracks to add to Tidal favorites")
 
 
+async def _add_favorites_in_order(add_function: Callable, names_by_id: Dict[int, str], kind: str) -> List[int]:
+    """
+    Add Tidal ids to the user's favorites using the given tidalapi add function, which accepts several ids per request.
+    The ids are sent in order, in chunks one after another, so that Tidal's date added order matches the backup.
+    Failed requests are reported and skipped.
+
+    Returns:
+        The ids that were added
+    """
+    tidal_ids = list(names_by_id)
+    chunks = [tidal_ids[offset:offset + FAVORITES_CHUNK_SIZE] for offset in range(0, len(tidal_ids), FAVORITES_CHUNK_SIZE)]
+    added_ids = []
+    for chunk in tqdm(chunks, desc=f"Adding new {kind}s to Tidal favorites"):
+        try:
+            added = await repeat_on_request_error(_tidal_call, add_function, [str(tidal_id) for tidal_id in chunk])
+        except Exception as e:
+            added = False
+            print(f"Failed to add {kind}s: {e}")
+        if added:
+            added_ids.extend(chunk)
+        else:
+            for tidal_id in chunk:
+                print(f"Failed to add {kind} '{names_by_id[tidal_id]}'")
+    return added_ids
+
+
 async def sync_albums_from_backup(
     tidal_session: tidalapi.Session,
     albums_data: List[dict],
+    config: dict,
 ) -> None:
     """
     Sync albums from backup data to Tidal.
@@ -319,6 +836,7 @@ async def sync_albums_from_backup(
     Args:
         tidal_session: Authenticated Tidal session
         albums_data: List of albums from backup
+        config: Configuration dictionary
     """
     if not albums_data:
         print("No albums in backup to sync")
@@ -327,37 +845,45 @@ async def sync_albums_from_backup(
     print(f"Syncing {len(albums_data)} albums from backup...")
 
     # Get existing Tidal favorite albums to avoid duplicates
-    print("Loading existing favorite albums from Tidal...")
-    tidal_favorite_albums = set()
-    try:
-        tidal_albums = tidal_session.user.favorites.albums()
-        for album in tidal_albums:
-            tidal_favorite_albums.add(album.id)
-    except Exception as e:
-        print(f"Warning: Could not fetch existing Tidal albums: {e}")
+    user_id = tidal_session.user.id
+    existing_album_ids = favorite_ids_cache.get(user_id, 'albums')
+    if existing_album_ids is None:
+        print("Loading existing favorite albums from Tidal...")
+        try:
+            existing_album_ids = {album.id for album in tidal_session.user.favorites.albums()}
+            favorite_ids_cache.set(user_id, 'albums', existing_album_ids)
+        except Exception as e:
+            print(f"Warning: Could not fetch existing Tidal albums: {e}")
+    else:
+        print("Using cached favorite albums from Tidal")
+    tidal_favorite_albums = set(existing_album_ids or ())
 
-    added_count = 0
+    albums_to_add = {}
     not_found = []
 
-    for spotify_album in tqdm(albums_data, desc="Syncing albums to Tidal"):
+    # Search for all albums on Tidal concurrently, then match the results in order
+    queries = []
+    for spotify_album in albums_data:
+        artist_name = spotify_album['artists'][0]['name'] if spotify_album.get('artists') else ''
+        queries.append(f"{simple(spotify_album['name'])} {simple(artist_name)}")
+    all_search_results = await search_tidal_concurrently(
+        tidal_session, queries, [tidalapi.album.Album], config, desc="Searching Tidal for albums"
+    )
+
+    for spotify_album, search_results in tqdm(zip(albums_data, all_search_results), total=len(albums_data), desc="Syncing albums to Tidal"):
         album_name = spotify_album['name']
         artist_name = spotify_album['artists'][0]['name'] if spotify_album.get('artists') else ''
 
-        # Search for album on Tidal
-        query = f"{simple(album_name)} {simple(artist_name)}"
         try:
-            search_results = tidal_session.search(query, models=[tidalapi.album.Album])
+            if isinstance(search_results, Exception):
+                raise search_results
             matched = False
 
             for tidal_album in search_results.get('albums', []):
                 if check_album_similarity(spotify_album, tidal_album):
                     if tidal_album.id not in tidal_favorite_albums:
-                        try:
-                            tidal_session.user.favorites.add_album(tidal_album.id)
-                            tidal_favorite_albums.add(tidal_album.id)
-                            added_count += 1
-                        except Exception as e:
-                            print(f"Failed to add album '{album_name}': {e}")
+                        tidal_favorite_albums.add(tidal_album.id)
+                        albums_to_add[tidal_album.id] = album_name
                     matched = True
                     break
 
@@ -367,6 +893,9 @@ async def sync_albums_from_backup(
             print(f"Error searching for album '{album_name}': {e}")
             not_found.append(f"{artist_name} - {album_name}")
 
+    added_ids = await _add_favorites_in_order(tidal_session.user.favorites.add_album, albums_to_add, 'album')
+    favorite_ids_cache.add(user_id, 'albums', added_ids)
+    added_count = len(added_ids)
     print(f"\nAlbum sync complete: {added_count} albums added to Tidal")
     if not_found:
         print(f"{len(not_found)} albums could not be found on Tidal")
@@ -375,6 +904,7 @@ async def sync_albums_from_backup(
 async def sync_artists_from_backup(
     tidal_session: tidalapi.Session,
     artists_data: List[dict],
+    config: dict,
 ) -> None:
     """
     Sync artists from backup data to Tidal.
@@ -382,6 +912,7 @@ async def sync_artists_from_backup(
     Args:
         tidal_session: Authenticated Tidal session
         artists_data: List of artists from backup
+        config: Configuration dictionary
     """
     if not artists_data:
         print("No artists in backup to sync")
@@ -390,37 +921,42 @@ async def sync_artists_from_backup(
     print(f"Syncing {len(artists_data)} artists from backup...")
 
     # Get existing Tidal favorite artists to avoid duplicates
-    print("Loading existing favorite artists from Tidal...")
-    tidal_favorite_artists = set()
-    try:
-        tidal_artists = tidal_session.user.favorites.artists()
-        for artist in tidal_artists:
-            tidal_favorite_artists.add(artist.id)
-    except Exception as e:
-        print(f"Warning: Could not fetch existing Tidal artists: {e}")
+    user_id = tidal_session.user.id
+    existing_artist_ids = favorite_ids_cache.get(user_id, 'artists')
+    if existing_artist_ids is None:
+        print("Loading existing favorite artists from Tidal...")
+        try:
+            existing_artist_ids = {artist.id for artist in tidal_session.user.favorites.artists()}
+            favorite_ids_cache.set(user_id, 'artists', existing_artist_ids)
+        except Exception as e:
+            print(f"Warning: Could not fetch existing Tidal artists: {e}")
+    else:
+        print("Using cached favorite artists from Tidal")
+    tidal_favorite_artists = set(existing_artist_ids or ())
 
-    added_count = 0
+    artists_to_add = {}
     not_found = []
 
-    for spotify_artist in tqdm(artists_data, desc="Syncing artists to Tidal"):
+    # Search for all artists on Tidal concurrently, then match the results in order
+    all_search_results = await search_tidal_concurrently(
+        tidal_session, [simple(a['name']) for a in artists_data], [tidalapi.artist.Artist], config, desc="Searching Tidal for artists"
+    )
+
+    for spotify_artist, search_results in tqdm(zip(artists_data, all_search_results), total=len(artists_data), desc="Syncing artists to Tidal"):
         artist_name = spotify_artist['name']
+        target_name = normalize(simple(artist_name.lower()))
 
-        # Search for artist on Tidal
-        query = simple(artist_name)
         try:
-            search_results = tidal_session.search(query, models=[tidalapi.artist.Artist])
+            if isinstance(search_results, Exception):
+                raise search_results
             matched = False
 
             for tidal_artist in search_results.get('artists', []):
                 # Match by normalized name comparison
-                if normalize(simple(tidal_artist.name.lower())) == normalize(simple(artist_name.lower())):
+                if normalize(simple(tidal_artist.name.lower())) == target_name:
                     if tidal_artist.id not in tidal_favorite_artists:
-                        try:
-                            tidal_session.user.favorites.add_artist(tidal_artist.id)
-                            tidal_favorite_artists.add(tidal_artist.id)
-                            added_count += 1
-                        except Exception as e:
-                            print(f"Failed to add artist '{artist_name}': {e}")
+                        tidal_favorite_artists.add(tidal_artist.id)
+                        artists_to_add[tidal_artist.id] = artist_name
                     matched = True
                     break
 
@@ -430,11 +966,37 @@ async def sync_artists_from_backup(
             print(f"Error searching for artist '{artist_name}': {e}")
             not_found.append(artist_name)
 
+    added_ids = await _add_favorites_in_order(tidal_session.user.favorites.add_artist, artists_to_add, 'artist')
+    favorite_ids_cache.add(user_id, 'artists', added_ids)
+    added_count = len(added_ids)
     print(f"\nArtist sync complete: {added_count} artists added to Tidal")
     if not_found:
         print(f"{len(not_found)} artists could not be found on Tidal")
 
 
+# Output buffer of the playlist sync running in the current task, see _PlaylistOutput
+_playlist_output: ContextVar[io.StringIO | None] = ContextVar('playlist_output', default=None)
+
+
+class _PlaylistOutput(io.TextIOBase):
+    """
+    Stands in for stdout while playlists are synced concurrently.
+    Writes from a playlist sync go to the output buffer of that playlist, everything else goes to the stream.
+    Progress bars and error diagnostics go to stderr, which isn't buffered.
+    """
+
+    def __init__(self, stream):
+        self._stream = stream
+
+    def write(self, s: str) -> int:
+        output = _playlist_output.get()
+        return (self._stream if output is None else output).write(s)
+
+    def flush(self):
+        if _playlist_output.get() is None:
+            self._stream.flush()
+
+
 async def import_from_backup(
     tidal_session: tidalapi.Session,
     backup_path: str,
@@ -455,32 +1017,83 @@ async def import_from_backup(
         sync_artists: Whether to sync artists from the backup
     """
     print(f"Loading backup from: {backup_path}")
-    backup_data = load_backup(backup_path)
+    # Playlists are read one at a time while syncing where the backup format allows it
+    backup_data = await aload_backup(backup_path, stream=True)
+    playlists = backup_data['playlists']
 
     print(f"Backup info:")
     print(f"  Exported at: {backup_data.get('exported_at', 'unknown')}")
     print(f"  Spotify user: {backup_data.get('spotify_user', 'unknown')}")
-    print(f"  Playlists: {len(backup_data['playlists'])}")
-    print(f"  Favorites: {len(backup_data.get('favorites', []))}")
-    print(f"  Albums: {len(backup_data.get('albums', []))}")
-    print(f"  Artists: {len(backup_data.get('artists', []))}")
+    if isinstance(playlists, list):
+        print(f"  Playlists: {len(playlists)}")
+        print(f"  Favorites: {len(backup_data.get('favorites', []))}")
+        print(f"  Albums: {len(backup_data.get('albums', []))}")
+        print(f"  Artists: {len(backup_data.get('artists', []))}")
 
     # Get existing Tidal playlists for matching
     print("\nFetching existing Tidal playlists...")
     tidal_playlist_list = await get_all_playlists(tidal_session.user)
     tidal_playlists = {playlist.name: playlist for playlist in tidal_playlist_list}
 
-    # Sync each playlist
-    for playlist_data in backup_data['playlists']:
-        playlist_name = playlist_data['name']
-        tidal_playlist = tidal_playlists.get(playlist_name)
+    # Sync several playlists concurrently so that their Tidal searches overlap. The searches share
+    # one rate limiter, and the printed output of each playlist is shown once the playlists before it are done
+    semaphore = asyncio.Semaphore(config.get('tidal_concurrency', 4))
+    # Playlists with the same name sync to the same Tidal playlist, so those are synced one after another
+    playlist_locks: Dict[str, asyncio.Lock] = {}
 
-        if tidal_playlist:
-            print(f"\nSyncing to existing Tidal playlist: '{playlist_name}'")
-        else:
-            print(f"\nWill create new Tidal playlist: '{playlist_name}'")
-
-        await sync_playlist_from_backup(tidal_session, playlist_data, tidal_playlist, config)
+    async def _sync_one_playlist(playlist_data: dict, output: io.StringIO, rate_limiter: asyncio.Semaphore) -> None:
+        _playlist_output.set(output)
+        try:
+            playlist_name = playlist_data['name']
+            async with playlist_locks.setdefault(playlist_name, asyncio.Lock()):
+                tidal_playlist = tidal_playlists.get(playlist_name)
+
+                if tidal_playlist:
+                    print(f"\nSyncing to existing Tidal playlist: '{playlist_name}'")
+                else:
+                    print(f"\nWill create new Tidal playlist: '{playlist_name}'")
+
+                await sync_playlist_from_backup(tidal_session, playlist_data, tidal_playlist, config, rate_limiter)
+        finally:
+            semaphore.release()
+
+    def _print_finished_playlists(pending: deque):
+        """ print the output of the finished playlists at the head of pending, and raise the error of any failed sync """
+        while pending and pending[0][0].done():
+            task, output = pending.popleft()
+            tqdm.write(output.getvalue(), end='')
+            task.result()
+        for task, _ in pending:
+            if task.done():
+                task.result()
+
+    # Acquire before reading the next playlist, so that streamed backups only hold the playlists being synced.
+    # Streamed playlists are parsed in a worker thread to keep the event loop free for the running syncs
+    pending = deque()
+    playlists = iter(playlists)
+    with contextlib.redirect_stdout(_PlaylistOutput(sys.stdout)):
+        try:
+            async with tidal_rate_limiter(config) as rate_limiter:
+                while True:
+                    await semaphore.acquire()
+                    _print_finished_playlists(pending)
+                    playlist_data = await asyncio.to_thread(next, playlists, None)
+                    if playlist_data is None:
+                        semaphore.release()
+                        break
+                    output = io.StringIO()
+                    pending.append((asyncio.create_task(_sync_one_playlist(playlist_data, output, rate_limiter)), output))
+                while pending:
+                    await asyncio.wait([task for task, _ in pending], return_when=asyncio.FIRST_COMPLETED)
+                    _print_finished_playlists(pending)
+        except BaseException:
+            # Stop the other syncs, and show what they printed so far
+            for task, _ in pending:
+                task.cancel()
+            await asyncio.gather(*(task for task, _ in pending), return_exceptions=True)
+            for _, output in pending:
+                tqdm.write(output.getvalue(), end='')
+            raise
 
     # Sync favorites if requested
     if sync_favorites and backup_data.get('favorites'):
@@ -490,12 +1103,12 @@ async def import_from_backup(
     # Sync albums if requested
     if sync_albums and backup_data.get('albums'):
         print("\n" + "=" * 50)
-        await sync_albums_from_backup(tidal_session, backup_data['albums'])
+        await sync_albums_from_backup(tidal_session, backup_data['albums'], config)
 
     # Sync artists if requested
     if sync_artists and backup_data.get('artists'):
         print("\n" + "=" * 50)
-        await sync_artists_from_backup(tidal_session, backup_data['artists'])
+        await sync_artists_from_backup(tidal_session, backup_data['artists'], config)
 
     print("\nImport complete!")
 
@@ -507,11 +1120,12 @@ def export_wrapper(
     include_favorites: bool = True,
     include_albums: bool = True,
     include_artists: bool = True,
+    pretty: bool = False,
 ):
     """Wrapper to run export in asyncio event loop."""
     asyncio.run(export_spotify_data(
         spotify_session, config, output_path,
-        include_favorites, include_albums, include_artists
+        include_favorites, include_albums, include_artists, pretty
     ))
 
 
@@ -1,7 +1,9 @@
 import datetime
+import json
+import os
 import sqlalchemy
 from sqlalchemy import Table, Column, String, DateTime, MetaData, insert, select, update, delete
-from typing import Dict, List, Sequence, Set, Mapping
+from typing import Dict, Iterable, List, Sequence, Set, Mapping
 
 
 class MatchFailureDatabase:
@@ -78,7 +80,124 @@ class TrackMatchCache:
     def insert(self, mapping: tuple[str, int]):
         self.data[mapping[0]] = mapping[1]
 
+    def insert_many(self, mappings: Mapping[str, int]):
+        """ inserts all spotify id -> tidal id pairs with a single dict update """
+        self.data.update(mappings)
+
+
+def _cache_directory() -> str:
+    """ directory of the caches which persist between runs, following the XDG base directory spec """
+    cache_home = os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+    return os.path.join(cache_home, 'spotify_to_tidal')
+
+
+class FavoriteIdsCache:
+    """
+    JSON file of the ids in each user's Tidal favorite albums/artists which persists between runs
+    entries expire after max_age so that changes made outside of this tool are picked up again
+    """
+
+    def __init__(self, filename: str | None = None, max_age: datetime.timedelta = datetime.timedelta(hours=1)):
+        self.filename = filename or os.path.join(_cache_directory(), 'favorite_ids.json')
+        self.max_age = max_age
+
+    def _load(self) -> Dict[str, dict]:
+        try:
+            with open(self.filename, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _save(self, entries: Dict[str, dict]):
+        try:
+            os.makedirs(os.path.dirname(self.filename) or '.', exist_ok=True)
+            with open(self.filename, 'w', encoding='utf-8') as f:
+                json.dump(entries, f)
+        except OSError as e:
+            print(f"Could not write favorites cache '{self.filename}': {e}")
+
+    def get(self, user_id, kind: str) -> Set[int] | None:
+        """ returns the cached favorite ids of the given kind, or None if they are missing or expired """
+        entry = self._load().get(f"{user_id}/{kind}")
+        if not entry:
+            return None
+        if datetime.datetime.now() - datetime.datetime.fromisoformat(entry['fetched_at']) > self.max_age:
+            return None
+        return set(entry['ids'])
+
+    def set(self, user_id, kind: str, ids: Iterable[int]):
+        """ stores freshly fetched favorite ids of the given kind """
+        entries = self._load()
+        entries[f"{user_id}/{kind}"] = {'fetched_at': datetime.datetime.now().isoformat(), 'ids': sorted(ids)}
+        self._save(entries)
+
+    def add(self, user_id, kind: str, ids: Iterable[int]):
+        """ adds newly favorited ids to a cached entry without extending its expiry """
+        entries = self._load()
+        entry = entries.get(f"{user_id}/{kind}")
+        if entry:
+            entry['ids'] = sorted(set(entry['ids']).union(ids))
+            self._save(entries)
+
+
+class PlaylistSnapshotCache:
+    """
+    Directory with one file per exported Spotify playlist holding its serialized simplified tracks
+    an entry is only used while its key (the backup version and the playlist's snapshot_id) is unchanged,
+    so unchanged playlists don't need to be fetched again. Entries are read and written one playlist at a time
+    """
+
+    def __init__(self, directory: str | None = None):
+        self.directory = directory or os.path.join(_cache_directory(), 'playlist_snapshots')
+
+    def _path(self, playlist_id: str) -> str | None:
+        # Spotify ids are base62, anything else isn't used as a file name
+        return os.path.join(self.directory, f"{playlist_id}.json") if playlist_id and playlist_id.isalnum() else None
+
+    def get(self, playlist_id: str, key: str) -> bytes | None:
+        """ returns the cached tracks of the playlist, or None if they aren't cached under this key """
+        path = self._path(playlist_id)
+        if path is None:
+            return None
+        try:
+            with open(path, 'rb') as f:
+                if f.readline().rstrip(b'\n') != key.encode('utf-8'):
+                    return None
+                return f.read()
+        except OSError:
+            return None
+
+    def set(self, playlist_id: str, key: str, tracks: bytes):
+        """ stores the serialized tracks of the playlist under the given key """
+        path = self._path(playlist_id)
+        if path is None:
+            return
+        temp_path = f"{path}.tmp"
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            with open(temp_path, 'wb') as f:
+                f.write(key.encode('utf-8') + b'\n' + tracks)
+            os.replace(temp_path, path)
+        except OSError as e:
+            print(f"Could not write playlist snapshot cache '{path}': {e}")
+
+    def prune(self, playlist_ids: Iterable[str]):
+        """ removes the entries of all playlists except the given ones """
+        keep = {f"{playlist_id}.json" for playlist_id in playlist_ids}
+        try:
+            filenames = os.listdir(self.directory)
+        except OSError:
+            return
+        for filename in filenames:
+            if filename not in keep:
+                try:
+                    os.remove(os.path.join(self.directory, filename))
+                except OSError:
+                    pass
+
 
 # Main singleton instance
 failure_cache = MatchFailureDatabase()
 track_match_cache = TrackMatchCache()
+favorite_ids_cache = FavoriteIdsCache()
+playlist_snapshot_cache = PlaylistSnapshotCache()
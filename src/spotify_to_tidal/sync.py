@@ -1,10 +1,12 @@
 #!/usr/bin/env python3
 
 import asyncio
+from concurrent.futures import ThreadPoolExecutor
+import contextlib
 from .cache import failure_cache, track_match_cache
 import datetime
 from difflib import SequenceMatcher
-from functools import partial
+from functools import lru_cache, partial
 from typing import Callable, List, Sequence, Set, Mapping
 import math
 import requests
@@ -21,9 +23,12 @@ import math
 
 from .type import spotify as t_spotify
 
+# the same artist, album and track names are normalized and simplified over and over during a sync
+@lru_cache(maxsize=8192)
 def normalize(s) -> str:
     return unicodedata.normalize('NFD', s).encode('ascii', 'ignore').decode('ascii')
 
+@lru_cache(maxsize=8192)
 def simple(input_string: str) -> str:
     # only take the first part of a string before any hyphens or brackets to account for different versions
     return input_string.split('-')[0].strip().split('(')[0].strip().split('[')[0].strip()
@@ -70,7 +75,7 @@ def artist_match(tidal: tidalapi.Track | tidalapi.Album, spotify) -> bool:
             else:
                 artist_name = artist.name
             result.extend(split_artist_name(artist_name))
-        return set([simple(x.strip().lower()) for x in result])
+        return {simple(x.strip().lower()) for x in result}
 
     def get_spotify_artists(spotify, do_normalize=False) -> Set[str]:
         result: list[str] = []
@@ -80,12 +85,12 @@ def artist_match(tidal: tidalapi.Track | tidalapi.Album, spotify) -> bool:
             else:
                 artist_name = artist['name']
             result.extend(split_artist_name(artist_name))
-        return set([simple(x.strip().lower()) for x in result])
+        return {simple(x.strip().lower()) for x in result}
     # There must be at least one overlapping artist between the Tidal and Spotify track
     # Try with both un-normalized and then normalized
-    if get_tidal_artists(tidal).intersection(get_spotify_artists(spotify)) != set():
+    if not get_tidal_artists(tidal).isdisjoint(get_spotify_artists(spotify)):
         return True
-    return get_tidal_artists(tidal, True).intersection(get_spotify_artists(spotify, True)) != set()
+    return not get_tidal_artists(tidal, True).isdisjoint(get_spotify_artists(spotify, True))
 
 def match(tidal_track, spotify_track) -> bool:
     if not spotify_track['id']: return False
@@ -123,35 +128,53 @@ async def tidal_search(spotify_track, rate_limiter, tidal_session: tidalapi.Sess
                 failure_cache.remove_match_failure(spotify_track['id'])
                 return track
     await rate_limiter.acquire()
-    album_search = await asyncio.to_thread( _search_for_track_in_album )
+    album_search = await _tidal_call( _search_for_track_in_album )
     if album_search:
         return album_search
     await rate_limiter.acquire()
-    track_search = await asyncio.to_thread( _search_for_standalone_track )
+    track_search = await _tidal_call( _search_for_standalone_track )
     if track_search:
         return track_search
 
     # if none of the search modes succeeded then store the track id to the failure cache
     failure_cache.cache_match_failure(spotify_track['id'])
 
+# Shared worker threads for blocking tidalapi calls made from async code, sized by the tidal_threads config option
+_TIDAL_POOL = ThreadPoolExecutor(max_workers=10, thread_name_prefix='tidal')
+
+def configure_tidal_pool(config: dict):
+    """ resize the shared Tidal thread pool to the tidal_threads config option """
+    global _TIDAL_POOL
+    _TIDAL_POOL.shutdown(wait=False)
+    _TIDAL_POOL = ThreadPoolExecutor(max_workers=config.get('tidal_threads', 10), thread_name_prefix='tidal')
+
+# Tidal searches currently running for each Spotify track id, so that playlists synced concurrently
+# wait for an in-flight search of a shared track instead of repeating it
+_searches_in_flight: dict[str, asyncio.Future] = {}
+
+async def _tidal_call(function, *args, **kwargs):
+    """ run a blocking tidalapi call in the shared Tidal thread pool """
+    return await asyncio.get_running_loop().run_in_executor(_TIDAL_POOL, partial(function, *args, **kwargs))
+
 async def repeat_on_request_error(function, *args, remaining=5, **kwargs):
     # utility to repeat calling the function up to 5 times if an exception is thrown
     try:
         return await function(*args, **kwargs)
     except (tidalapi.exceptions.TooManyRequests, requests.exceptions.RequestException, spotipy.exceptions.SpotifyException) as e:
+        # diagnostics go to stderr, which isn't buffered while backup playlists are imported concurrently
         if remaining:
-            print(f"{str(e)} occurred, retrying {remaining} times")
+            print(f"{str(e)} occurred, retrying {remaining} times", file=sys.stderr)
         else:
-            print(f"{str(e)} could not be recovered")
+            print(f"{str(e)} could not be recovered", file=sys.stderr)
 
         if isinstance(e, requests.exceptions.RequestException) and not e.response is None:
-            print(f"Response message: {e.response.text}")
-            print(f"Response headers: {e.response.headers}")
+            print(f"Response message: {e.response.text}", file=sys.stderr)
+            print(f"Response headers: {e.response.headers}", file=sys.stderr)
 
         if not remaining:
-            print("Aborting sync")
-            print(f"The following arguments were provided:\n\n {str(args)}")
-            print(traceback.format_exc())
+            print("Aborting sync", file=sys.stderr)
+            print(f"The following arguments were provided:\n\n {str(args)}", file=sys.stderr)
+            print(traceback.format_exc(), file=sys.stderr)
             sys.exit(1)
         sleep_schedule = {5: 1, 4:10, 3:60, 2:5*60, 1:10*60} # sleep variable length of time depending on retry number
         time.sleep(sleep_schedule.get(remaining, 1))
@@ -160,7 +183,7 @@ async def repeat_on_request_error(function, *args, remaining=5, **kwargs):
 
 async def _fetch_all_from_spotify_in_chunks(fetch_function: Callable) -> List[dict]:
     output = []
-    results = fetch_function(0)
+    results = await asyncio.to_thread(fetch_function, 0)
     output.extend([item['track'] for item in results['items'] if item['track'] is not None])
 
     # Get all the remaining tracks in parallel
@@ -245,38 +268,104 @@ def get_tracks_for_new_tidal_playlist(spotify_tracks: Sequence[t_spotify.Spotify
                 seen_tracks.add(tidal_id)
     return output
 
-async def search_new_tracks_on_tidal(tidal_session: tidalapi.Session, spotify_tracks: Sequence[t_spotify.SpotifyTrack], playlist_name: str, config: dict):
-    """ Generic function for searching for each item in a list of Spotify tracks which have not already been seen and adding them to the cache """
-    async def _run_rate_limiter(semaphore):
-        ''' Leaky bucket algorithm for rate limiting. Periodically releases items from semaphore at rate_limit'''
-        _sleep_time = config.get('max_concurrency', 10)/config.get('rate_limit', 10)/4 # aim to sleep approx time to drain 1/4 of 'bucket'
-        t0 = datetime.datetime.now()
-        while True:
-            await asyncio.sleep(_sleep_time)
-            t = datetime.datetime.now()
-            dt = (t - t0).total_seconds()
-            new_items = round(config.get('rate_limit', 10)*dt)
-            t0 = t
-            [semaphore.release() for i in range(new_items)] # leak new_items from the 'bucket'
-
+async def _run_rate_limiter(semaphore: asyncio.Semaphore, config: dict):
+    ''' Leaky bucket algorithm for rate limiting. Periodically releases items from semaphore at rate_limit'''
+    _sleep_time = config.get('max_concurrency', 10)/config.get('rate_limit', 10)/4 # aim to sleep approx time to drain 1/4 of 'bucket'
+    t0 = datetime.datetime.now()
+    while True:
+        await asyncio.sleep(_sleep_time)
+        t = datetime.datetime.now()
+        dt = (t - t0).total_seconds()
+        new_items = round(config.get('rate_limit', 10)*dt)
+        t0 = t
+        [semaphore.release() for i in range(new_items)] # leak new_items from the 'bucket'
+
+@contextlib.asynccontextmanager
+async def tidal_rate_limiter(config: dict):
+    """
+    Yields a semaphore to acquire before each Tidal search, allowing max_concurrency searches at once
+    and rate_limit searches per second. Searches running concurrently should share one of these.
+    """
+    semaphore = asyncio.Semaphore(config.get('max_concurrency', 10))
+    rate_limiter_task = asyncio.create_task(_run_rate_limiter(semaphore, config))
+    try:
+        yield semaphore
+    finally:
+        rate_limiter_task.cancel()
+
+async def search_tidal_concurrently(tidal_session: tidalapi.Session, queries: Sequence[str], models: list, config: dict, desc: str) -> list:
+    """
+    Run several Tidal searches concurrently, limited by the tidal_search_concurrency config option
+    and by a tidal_rate_limiter. Searches are retried on request errors, and repeated queries are only searched once.
+    Results are returned in the order of the queries, and a failed search returns its exception instead of raising it.
+    """
+    semaphore = asyncio.Semaphore(config.get('tidal_search_concurrency', 6))
+
+    async def _rate_limited_search(query: str, rate_limiter: asyncio.Semaphore):
+        await rate_limiter.acquire()
+        return await _tidal_call(tidal_session.search, query, models=models)
+
+    async def _search(query: str, rate_limiter: asyncio.Semaphore):
+        async with semaphore:
+            try:
+                return await repeat_on_request_error(_rate_limited_search, query, rate_limiter)
+            except Exception as e:
+                return e
+
+    unique_queries = list(dict.fromkeys(queries))
+    async with tidal_rate_limiter(config) as rate_limiter:
+        results = await atqdm.gather(*[_search(query, rate_limiter) for query in unique_queries], desc=desc)
+    results_by_query = dict(zip(unique_queries, results))
+    return [results_by_query[query] for query in queries]
+
+async def search_new_tracks_on_tidal(tidal_session: tidalapi.Session, spotify_tracks: Sequence[t_spotify.SpotifyTrack], playlist_name: str, config: dict,
+                                     rate_limiter: asyncio.Semaphore | None = None):
+    """
+    Generic function for searching for each item in a list of Spotify tracks which have not already been seen and adding them to the cache.
+    A rate_limiter from tidal_rate_limiter is used for the searches if given, otherwise the searches get their own.
+    """
     # Extract the new tracks that do not already exist in the old tidal tracklist
     tracks_to_search = get_new_spotify_tracks(spotify_tracks)
     if not tracks_to_search:
         return
 
-    # Search for each of the tracks on Tidal concurrently
-    task_description = "Searching Tidal for {}/{} tracks in Spotify playlist '{}'".format(len(tracks_to_search), len(spotify_tracks), playlist_name)
-    semaphore = asyncio.Semaphore(config.get('max_concurrency', 10))
-    rate_limiter_task = asyncio.create_task(_run_rate_limiter(semaphore))
-    search_results = await atqdm.gather( *[ repeat_on_request_error(tidal_search, t, semaphore, tidal_session) for t in tracks_to_search ], desc=task_description )
-    rate_limiter_task.cancel()
+    # Only search for tracks which aren't already being searched for, the others are awaited below
+    loop = asyncio.get_running_loop()
+    own_searches = {}
+    awaited_tracks, awaited_searches = [], []
+    new_tracks = []
+    for spotify_track in tracks_to_search:
+        if spotify_track['id'] in _searches_in_flight:
+            awaited_tracks.append(spotify_track)
+            awaited_searches.append(_searches_in_flight[spotify_track['id']])
+        else:
+            own_searches[spotify_track['id']] = _searches_in_flight[spotify_track['id']] = loop.create_future()
+            new_tracks.append(spotify_track)
 
-    # Add the search results to the cache
+    # Search for each of the tracks on Tidal concurrently
+    search_results = []
+    try:
+        if new_tracks:
+            task_description = "Searching Tidal for {}/{} tracks in Spotify playlist '{}'".format(len(new_tracks), len(spotify_tracks), playlist_name)
+            async with contextlib.nullcontext(rate_limiter) if rate_limiter else tidal_rate_limiter(config) as semaphore:
+                search_results = await atqdm.gather( *[ repeat_on_request_error(tidal_search, t, semaphore, tidal_session) for t in new_tracks ], desc=task_description )
+            # Add the search results to the cache before they stop being in flight
+            track_match_cache.insert_many({spotify_track['id']: result.id for spotify_track, result in zip(new_tracks, search_results) if result})
+    finally:
+        # let any waiting playlists continue, treating a failed search as not found
+        for spotify_track, result in zip(new_tracks, search_results):
+            own_searches[spotify_track['id']].set_result(result)
+        for track_id, future in own_searches.items():
+            if not future.done():
+                future.set_result(None)
+            del _searches_in_flight[track_id]
+    tracks_to_search = new_tracks + awaited_tracks
+    search_results = list(search_results) + list(await asyncio.gather(*awaited_searches))
+
+    # Report the tracks which couldn't be found
     song404 = []
     for idx, spotify_track in enumerate(tracks_to_search):
-        if search_results[idx]:
-            track_match_cache.insert( (spotify_track['id'], search_results[idx].id) )
-        else:
+        if not search_results[idx]:
             song404.append(f"{spotify_track['id']}: {','.join([a['name'] for a in spotify_track['artists']])} - {spotify_track['name']}")
             color = ('\033[91m', '\033[0m')
             print(color[0] + "Could not find the track " + song404[-1] + color[1])
@@ -327,7 +416,7 @@ async def sync_favorites(spotify_session: spotipy.Spotify, tidal_session: tidala
         return tracks
 
     def get_new_tidal_favorites() -> List[int]:
-        existing_favorite_ids = set([track.id for track in old_tidal_tracks])
+        existing_favorite_ids = {track.id for track in old_tidal_tracks}
         new_ids = []
         for spotify_track in spotify_tracks:
             match_id = track_match_cache.get(spotify_track['id'])
@@ -381,7 +470,7 @@ async def get_playlists_from_spotify(spotify_session: spotipy.Spotify, config):
     playlists = []
     print("Loading Spotify playlists")
     first_results = spotify_session.current_user_playlists()
-    exclude_list = set([x.split(':')[-1] for x in config.get('excluded_playlists', [])])
+    exclude_list = {x.split(':')[-1] for x in config.get('excluded_playlists', [])}
     playlists.extend([p for p in first_results['items']])
     user_id = spotify_session.current_user()['id']
 
@@ -421,7 +510,7 @@ async def get_albums_from_spotify(spotify_session: spotipy.Spotify) -> List[dict
     """Fetch all saved albums from Spotify user library."""
     print("Loading saved albums from Spotify")
     albums = []
-    first_results = spotify_session.current_user_saved_albums(limit=50)
+    first_results = await asyncio.to_thread(spotify_session.current_user_saved_albums, limit=50)
     albums.extend([item['album'] for item in first_results['items']])
 
     if first_results['next']:
@@ -446,23 +535,29 @@ async def sync_albums(spotify_session: spotipy.Spotify, tidal_session: tidalapi.
     print("Loading existing favorite albums from Tidal")
     tidal_favorite_albums = set()
     try:
-        tidal_albums = tidal_session.user.favorites.albums()
-        for album in tidal_albums:
-            tidal_favorite_albums.add(album.id)
+        tidal_favorite_albums = {album.id for album in tidal_session.user.favorites.albums()}
     except Exception as e:
         print(f"Warning: Could not fetch existing Tidal albums: {e}")
 
     added_count = 0
     not_found = []
 
-    for spotify_album in tqdm(spotify_albums, desc="Syncing albums to Tidal"):
+    # Search for all albums on Tidal concurrently, then match the results in order
+    queries = []
+    for spotify_album in spotify_albums:
+        artist_name = spotify_album['artists'][0]['name'] if spotify_album.get('artists') else ''
+        queries.append(f"{simple(spotify_album['name'])} {simple(artist_name)}")
+    all_search_results = await search_tidal_concurrently(
+        tidal_session, queries, [tidalapi.album.Album], config, desc="Searching Tidal for albums"
+    )
+
+    for spotify_album, search_results in tqdm(zip(spotify_albums, all_search_results), total=len(spotify_albums), desc="Syncing albums to Tidal"):
         album_name = spotify_album['name']
         artist_name = spotify_album['artists'][0]['name'] if spotify_album.get('artists') else ''
 
-        # Search for album on Tidal
-        query = f"{simple(album_name)} {simple(artist_name)}"
         try:
-            search_results = tidal_session.search(query, models=[tidalapi.album.Album])
+            if isinstance(search_results, Exception):
+                raise search_results
             matched = False
 
             for tidal_album in search_results.get('albums', []):
@@ -501,13 +596,13 @@ async def get_artists_from_spotify(spotify_session: spotipy.Spotify) -> List[dic
     """Fetch all followed artists from Spotify."""
     print("Loading followed artists from Spotify")
     artists = []
-    results = spotify_session.current_user_followed_artists(limit=50)
+    results = await asyncio.to_thread(spotify_session.current_user_followed_artists, limit=50)
     artists.extend(results['artists']['items'])
 
     # Spotify uses cursor-based pagination for followed artists
     while results['artists']['next']:
         last_artist_id = artists[-1]['id'] if artists else None
-        results = spotify_session.current_user_followed_artists(limit=50, after=last_artist_id)
+        results = await asyncio.to_thread(spotify_session.current_user_followed_artists, limit=50, after=last_artist_id)
         artists.extend(results['artists']['items'])
 
     return artists
@@ -522,27 +617,30 @@ async def sync_artists(spotify_session: spotipy.Spotify, tidal_session: tidalapi
     print("Loading existing favorite artists from Tidal")
     tidal_favorite_artists = set()
     try:
-        tidal_artists = tidal_session.user.favorites.artists()
-        for artist in tidal_artists:
-            tidal_favorite_artists.add(artist.id)
+        tidal_favorite_artists = {artist.id for artist in tidal_session.user.favorites.artists()}
     except Exception as e:
         print(f"Warning: Could not fetch existing Tidal artists: {e}")
 
     added_count = 0
     not_found = []
 
-    for spotify_artist in tqdm(spotify_artists, desc="Syncing artists to Tidal"):
+    # Search for all artists on Tidal concurrently, then match the results in order
+    all_search_results = await search_tidal_concurrently(
+        tidal_session, [simple(a['name']) for a in spotify_artists], [tidalapi.artist.Artist], config, desc="Searching Tidal for artists"
+    )
+
+    for spotify_artist, search_results in tqdm(zip(spotify_artists, all_search_results), total=len(spotify_artists), desc="Syncing artists to Tidal"):
         artist_name = spotify_artist['name']
+        target_name = normalize(simple(artist_name.lower()))
 
-        # Search for artist on Tidal
-        query = simple(artist_name)
         try:
-            search_results = tidal_session.search(query, models=[tidalapi.artist.Artist])
+            if isinstance(search_results, Exception):
+                raise search_results
             matched = False
 
             for tidal_artist in search_results.get('artists', []):
                 # Match by normalized name comparison
-                if normalize(simple(tidal_artist.name.lower())) == normalize(simple(artist_name.lower())):
+                if normalize(simple(tidal_artist.name.lower())) == target_name:
                     if tidal_artist.id not in tidal_favorite_artists:
                         try:
                             tidal_session.user.favorites.add_artist(tidal_artist.id)
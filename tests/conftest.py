@@ -2,4 +2,17 @@ import sys
 import os
 
 # Add the src directory to the Python path
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../src")))
\ No newline at end of file
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../src")))
+
+import pytest
+
+from spotify_to_tidal.cache import track_match_cache
+
+
+@pytest.fixture
+def restore_track_match_cache():
+    """ Restores the global track match cache after tests which add matches to it """
+    data = dict(track_match_cache.data)
+    yield track_match_cache
+    track_match_cache.data.clear()
+    track_match_cache.data.update(data)
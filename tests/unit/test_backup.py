@@ -1,18 +1,34 @@
 # tests/unit/test_backup.py
 
+import asyncio
 import json
 import pytest
 import tempfile
+import time
 from pathlib import Path
+from unittest.mock import MagicMock
 
 from spotify_to_tidal.backup import (
+    _BackupWriter,
+    _MsgpackBackupWriter,
+    _NdjsonBackupWriter,
+    _add_favorites_in_order,
+    _dumps,
+    _match_tracks_by_isrc,
     _simplify_track,
     _simplify_playlist,
     _simplify_album,
     _simplify_artist,
+    dump_backup,
+    export_spotify_data,
+    import_from_backup,
     load_backup,
+    load_backups,
+    sync_favorites_from_backup,
     BACKUP_VERSION,
+    FAVORITES_CHUNK_SIZE,
 )
+from spotify_to_tidal.cache import PlaylistSnapshotCache, track_match_cache
 
 
 # Sample data fixtures
@@ -158,6 +174,149 @@ def test_simplify_playlist_handles_empty_tracks(sample_playlist):
     assert result['tracks'] == []
 
 
+# Test _BackupWriter
+@pytest.mark.parametrize('indent', [False, True])
+def test_backup_writer_streams_loadable_backup(indent, temp_backup_file, sample_playlist, sample_spotify_track):
+    playlist = _simplify_playlist(sample_playlist, [sample_spotify_track])
+
+    with open(temp_backup_file, 'wb') as f:
+        writer = _BackupWriter(f, indent=indent)
+        writer.write_field('version', BACKUP_VERSION)
+        writer.begin_list('playlists')
+        writer.append(playlist)
+        writer.append(playlist)
+        writer.end_list()
+        writer.begin_list('favorites')
+        writer.end_list()
+        writer.write_field('albums', [{'id': 'album1', 'name': 'Album', 'artists': []}])
+        writer.close()
+
+    with open(temp_backup_file, 'r', encoding='utf-8') as f:
+        result = json.load(f)
+
+    assert result == {
+        'version': BACKUP_VERSION,
+        'playlists': [playlist, playlist],
+        'favorites': [],
+        'albums': [{'id': 'album1', 'name': 'Album', 'artists': []}],
+    }
+    assert Path(temp_backup_file).read_bytes() == _dumps(result, indent=indent)
+
+
+def test_ndjson_backup_writer_round_trip(sample_playlist, sample_spotify_track):
+    playlist = _simplify_playlist(sample_playlist, [sample_spotify_track])
+    favorite = _simplify_track(sample_spotify_track)
+
+    with tempfile.NamedTemporaryFile(suffix='.ndjson', delete=False) as f:
+        temp_path = f.name
+        writer = _NdjsonBackupWriter(f)
+        writer.write_field('version', BACKUP_VERSION)
+        writer.write_field('spotify_user', 'testuser')
+        writer.begin_list('playlists')
+        writer.append(playlist)
+        writer.end_list()
+        writer.begin_list('favorites')
+        writer.append(favorite)
+        writer.end_list()
+        writer.close()
+
+    try:
+        with open(temp_path, 'r', encoding='utf-8') as f:
+            lines = [json.loads(line) for line in f]
+        assert [line['type'] for line in lines] == ['header', 'playlist', 'favorite']
+
+        result = load_backup(temp_path)
+        assert result['version'] == BACKUP_VERSION
+        assert result['spotify_user'] == 'testuser'
+        assert result['playlists'] == [playlist]
+        assert result['favorites'] == [favorite]
+        assert result['albums'] == []
+    finally:
+        Path(temp_path).unlink(missing_ok=True)
+
+
+def test_msgpack_backup_writer_round_trip(sample_playlist, sample_spotify_track):
+    pytest.importorskip('msgpack')
+    playlist = _simplify_playlist(sample_playlist, [sample_spotify_track])
+
+    with tempfile.NamedTemporaryFile(suffix='.msgpack', delete=False) as f:
+        temp_path = f.name
+        writer = _MsgpackBackupWriter(f)
+        writer.write_field('version', BACKUP_VERSION)
+        writer.begin_list('playlists')
+        writer.append(playlist)
+        writer.end_list()
+        writer.close()
+
+    try:
+        result = load_backup(temp_path)
+        assert result == {'version': BACKUP_VERSION, 'playlists': [playlist]}
+    finally:
+        Path(temp_path).unlink(missing_ok=True)
+
+
+def test_load_backup_stream_matches_full_load(temp_backup_file, sample_playlist, sample_spotify_track):
+    pytest.importorskip('ijson')
+    backup_data = {
+        'version': BACKUP_VERSION,
+        'spotify_user': 'testuser',
+        'playlists': [_simplify_playlist(sample_playlist, [sample_spotify_track])],
+        'favorites': [_simplify_track(sample_spotify_track)],
+        'albums': [],
+        'artists': [{'id': 'artist1', 'name': 'Artist'}],
+    }
+    with open(temp_backup_file, 'w') as f:
+        json.dump(backup_data, f)
+
+    result = load_backup(temp_backup_file, stream=True)
+    assert result['version'] == BACKUP_VERSION
+    assert list(result['playlists']) == backup_data['playlists']
+    assert {**result, 'playlists': backup_data['playlists']} == backup_data
+
+
+@pytest.mark.parametrize('backup_json', [
+    '{"playlists": [], "version": %d}' % BACKUP_VERSION,
+    '{"favorites": [], "playlists": [{"name": "Playlist 1"}], "version": %d}' % BACKUP_VERSION,
+    '{"playlists": []}',
+    '{"version": %d}' % BACKUP_VERSION,
+    '{"version": %d, "favorites": []}' % BACKUP_VERSION,
+    '{"playlists": [], "version": %d}' % (BACKUP_VERSION + 1),
+])
+def test_load_backup_stream_validates_like_full_load(temp_backup_file, backup_json):
+    pytest.importorskip('ijson')
+    with open(temp_backup_file, 'w') as f:
+        f.write(backup_json)
+
+    try:
+        expected = load_backup(temp_backup_file)
+    except ValueError as e:
+        with pytest.raises(ValueError, match=str(e)):
+            load_backup(temp_backup_file, stream=True)
+    else:
+        result = load_backup(temp_backup_file, stream=True)
+        assert {**result, 'playlists': list(result['playlists'])} == expected
+
+
+@pytest.mark.parametrize('suffix', ['.json', '.ndjson'])
+def test_dump_backup_round_trip(suffix, sample_playlist, sample_spotify_track):
+    backup_data = {
+        'version': BACKUP_VERSION,
+        'spotify_user': 'testuser',
+        'playlists': [_simplify_playlist(sample_playlist, [sample_spotify_track])],
+        'favorites': [_simplify_track(sample_spotify_track)],
+        'albums': [],
+        'artists': [],
+    }
+    with tempfile.NamedTemporaryFile(suffix=suffix, delete=False) as f:
+        temp_path = f.name
+
+    try:
+        dump_backup(backup_data, temp_path)
+        assert load_backup(temp_path) == backup_data
+    finally:
+        Path(temp_path).unlink(missing_ok=True)
+
+
 # Test load_backup
 def test_load_backup_valid_file(temp_backup_file):
     backup_data = {
@@ -266,6 +425,18 @@ def test_load_backup_with_tracks(temp_backup_file):
     assert result['favorites'][0]['name'] == 'Favorite Song'
 
 
+def test_load_backups_keeps_path_order(tmp_path):
+    paths = []
+    for username in ('first_user', 'second_user', 'third_user'):
+        path = tmp_path / f"{username}.json"
+        path.write_text(json.dumps({'version': BACKUP_VERSION, 'spotify_user': username, 'playlists': []}))
+        paths.append(str(path))
+
+    results = load_backups(paths)
+
+    assert [result['spotify_user'] for result in results] == ['first_user', 'second_user', 'third_user']
+
+
 # Test _simplify_album
 def test_simplify_album_extracts_required_fields():
     album = {
@@ -380,3 +551,205 @@ def test_load_backup_version_1_compatible(temp_backup_file):
     assert result['version'] == 1
     assert result.get('albums') is None
     assert result.get('artists') is None
+
+
+# Test _match_tracks_by_isrc
+def _make_tidal_track(track_id, isrc, available=True):
+    tidal_track = MagicMock()
+    tidal_track.id = track_id
+    tidal_track.isrc = isrc
+    tidal_track.available = available
+    return tidal_track
+
+
+def test_match_tracks_by_isrc_caches_matches(restore_track_match_cache):
+    spotify_tracks = [
+        {'id': 'isrc_track1', 'external_ids': {'isrc': 'ISRC1'}},
+        {'id': 'isrc_track2', 'external_ids': {'isrc': 'ISRC2'}},
+        {'id': 'isrc_track3', 'external_ids': {}},
+    ]
+    tidal_tracks = [
+        _make_tidal_track(101, 'ISRC1'),
+        _make_tidal_track(102, 'ISRC2', available=False),
+        _make_tidal_track(103, 'ISRC3'),
+    ]
+
+    unmatched_spotify, unmatched_tidal = _match_tracks_by_isrc(spotify_tracks, tidal_tracks)
+
+    assert track_match_cache.get('isrc_track1') == 101
+    assert track_match_cache.get('isrc_track2') is None
+    assert [t['id'] for t in unmatched_spotify] == ['isrc_track2', 'isrc_track3']
+    assert [t.id for t in unmatched_tidal] == [102, 103]
+
+
+@pytest.mark.asyncio
+async def test_add_favorites_in_order_skips_failed_requests():
+    add_function = MagicMock(side_effect=[True, False])
+    names_by_id = {tidal_id: f"Album {tidal_id}" for tidal_id in range(FAVORITES_CHUNK_SIZE + 1)}
+
+    added_ids = await _add_favorites_in_order(add_function, names_by_id, 'album')
+
+    assert added_ids == list(range(FAVORITES_CHUNK_SIZE))
+    assert add_function.call_args_list[0].args[0] == [str(tidal_id) for tidal_id in range(FAVORITES_CHUNK_SIZE)]
+    assert add_function.call_args_list[1].args[0] == [str(FAVORITES_CHUNK_SIZE)]
+
+
+@pytest.mark.asyncio
+async def test_sync_favorites_from_backup_reports_failed_requests(mocker, capsys, restore_track_match_cache):
+    favorites = [
+        {'id': 'favorite_track1', 'name': 'Old Song', 'artists': [{'name': 'Artist'}], 'external_ids': {}},
+        {'id': 'favorite_track2', 'name': 'New Song', 'artists': [{'name': 'Artist'}], 'external_ids': {}},
+    ]
+    track_match_cache.insert_many({'favorite_track1': 301, 'favorite_track2': 302})
+    mocker.patch('spotify_to_tidal.backup.get_all_favorites', return_value=[])
+    mocker.patch('spotify_to_tidal.backup.search_new_tracks_on_tidal')
+    tidal_session = MagicMock()
+    tidal_session.user.favorites.add_track.return_value = False
+
+    await sync_favorites_from_backup(tidal_session, favorites, {})
+
+    tidal_session.user.favorites.add_track.assert_called_once_with(['301', '302'])
+    assert "Failed to add track 'Artist - Old Song'" in capsys.readouterr().out
+
+
+def _mock_import(mocker, playlists, tidal_playlists=()):
+    backup_data = {'version': BACKUP_VERSION, 'playlists': playlists}
+    mocker.patch('spotify_to_tidal.backup.aload_backup', return_value=backup_data)
+    mocker.patch('spotify_to_tidal.backup.get_all_playlists', return_value=list(tidal_playlists))
+
+
+@pytest.mark.asyncio
+async def test_import_from_backup_syncs_same_named_playlists_in_turn(mocker):
+    tidal_playlist = MagicMock()
+    tidal_playlist.name = 'Same'
+    _mock_import(mocker, [{'name': 'Same', 'tracks': [1, 2]}, {'name': 'Other', 'tracks': [4]}, {'name': 'Same', 'tracks': [3]}], [tidal_playlist])
+    events = []
+
+    async def _fake_sync(tidal_session, playlist_data, tidal_playlist, *args, **kwargs):
+        events.append(('start', playlist_data['tracks']))
+        await asyncio.sleep(0.01)
+        events.append(('end', playlist_data['tracks']))
+
+    mocker.patch('spotify_to_tidal.backup.sync_playlist_from_backup', side_effect=_fake_sync)
+
+    await import_from_backup(MagicMock(), 'backup.json', {})
+
+    same_events = [event for event in events if event[1] != [4]]
+    assert same_events == [('start', [1, 2]), ('end', [1, 2]), ('start', [3]), ('end', [3])]
+
+
+@pytest.mark.asyncio
+async def test_import_from_backup_prints_playlists_in_order(mocker, capsys):
+    _mock_import(mocker, [{'name': 'Slow', 'tracks': [1]}, {'name': 'Fast', 'tracks': [2]}])
+
+    async def _fake_sync(tidal_session, playlist_data, *args, **kwargs):
+        print(f"{playlist_data['name']} started")
+        await asyncio.sleep(0.02 if playlist_data['name'] == 'Slow' else 0)
+        print(f"{playlist_data['name']} finished")
+
+    mocker.patch('spotify_to_tidal.backup.sync_playlist_from_backup', side_effect=_fake_sync)
+
+    await import_from_backup(MagicMock(), 'backup.json', {})
+
+    lines = [line for line in capsys.readouterr().out.splitlines() if line.endswith(('started', 'finished'))]
+    assert lines == ['Slow started', 'Slow finished', 'Fast started', 'Fast finished']
+
+
+@pytest.mark.asyncio
+async def test_import_from_backup_raises_sync_errors_and_prints_pending_output(mocker, capsys):
+    _mock_import(mocker, [{'name': 'Slow', 'tracks': [1]}, {'name': 'Broken', 'tracks': [2]}])
+
+    async def _fake_sync(tidal_session, playlist_data, *args, **kwargs):
+        print(f"{playlist_data['name']} started")
+        if playlist_data['name'] == 'Broken':
+            raise RuntimeError("sync failed")
+        await asyncio.sleep(10)
+        print(f"{playlist_data['name']} finished")
+
+    mocker.patch('spotify_to_tidal.backup.sync_playlist_from_backup', side_effect=_fake_sync)
+
+    with pytest.raises(RuntimeError, match="sync failed"):
+        await asyncio.wait_for(import_from_backup(MagicMock(), 'backup.json', {}), timeout=5)
+
+    out = capsys.readouterr().out
+    assert out.index('Slow started') < out.index('Broken started')
+    assert 'Slow finished' not in out
+
+
+def _export_track(number):
+    return {
+        'id': f'export_track{number}', 'name': f'Song {number}', 'duration_ms': 1000, 'track_number': 1,
+        'external_ids': {}, 'artists': [{'name': 'Artist'}], 'album': {'name': 'Album', 'artists': [{'name': 'Artist'}]},
+    }
+
+
+@pytest.fixture
+def mock_export_spotify(mocker, tmp_path):
+    """Spotify session with three playlists, two saved tracks, an album and an artist, and a snapshot cache in tmp_path."""
+    mocker.patch('spotify_to_tidal.backup.playlist_snapshot_cache', PlaylistSnapshotCache(str(tmp_path / 'snapshots')))
+    spotify = MagicMock()
+    spotify.current_user.return_value = {'id': 'user123'}
+    playlists = [
+        {'id': f'playlist{n}', 'name': f'Playlist {n}', 'description': '', 'owner': {'id': 'user123'}, 'snapshot_id': f'snapshot{n}'}
+        for n in range(3)
+    ]
+    spotify.current_user_playlists.return_value = {'items': playlists, 'next': None, 'limit': 50, 'total': 3}
+
+    def _playlist_tracks(playlist_id, fields, offset):
+        number = int(playlist_id.removeprefix('playlist'))
+        if number == 0:
+            time.sleep(0.05)  # the first playlist finishes last
+        return {'items': [{'track': _export_track(number)}], 'next': None, 'limit': 100, 'total': 1}
+
+    spotify.playlist_tracks.side_effect = _playlist_tracks
+    # saved tracks are returned most recently saved first
+    spotify.current_user_saved_tracks.return_value = {
+        'items': [{'track': _export_track(11)}, {'track': _export_track(10)}], 'next': None, 'limit': 20, 'total': 2,
+    }
+    spotify.current_user_saved_albums.return_value = {
+        'items': [{'album': {'id': 'album1', 'name': 'Album', 'artists': [{'name': 'Artist'}]}}], 'next': None, 'limit': 50, 'total': 1,
+    }
+    spotify.current_user_followed_artists.return_value = {'artists': {'items': [{'id': 'artist1', 'name': 'Artist'}], 'next': None}}
+    return spotify
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize('suffix', ['.json', '.ndjson', '.msgpack'])
+async def test_export_spotify_data_writes_playlists_in_order(mock_export_spotify, tmp_path, suffix):
+    if suffix == '.msgpack':
+        pytest.importorskip('msgpack')
+    output_path = tmp_path / f'backup{suffix}'
+
+    await export_spotify_data(mock_export_spotify, {'spotify_concurrency': 2}, str(output_path))
+
+    result = load_backup(str(output_path))
+    assert [playlist['name'] for playlist in result['playlists']] == ['Playlist 0', 'Playlist 1', 'Playlist 2']
+    assert [playlist['tracks'][0]['id'] for playlist in result['playlists']] == ['export_track0', 'export_track1', 'export_track2']
+    assert [track['id'] for track in result['favorites']] == ['export_track10', 'export_track11']
+    assert result['albums'] == [{'id': 'album1', 'name': 'Album', 'artists': [{'name': 'Artist'}]}]
+    assert result['artists'] == [{'id': 'artist1', 'name': 'Artist'}]
+
+
+@pytest.mark.asyncio
+async def test_export_spotify_data_removes_temp_file_on_failure(mock_export_spotify, tmp_path):
+    mock_export_spotify.playlist_tracks.side_effect = RuntimeError("fetch failed")
+    output_path = tmp_path / 'backup.json'
+
+    with pytest.raises(RuntimeError, match="fetch failed"):
+        await export_spotify_data(mock_export_spotify, {}, str(output_path))
+
+    assert not output_path.exists()
+    assert not (tmp_path / 'backup.json.tmp').exists()
+
+
+@pytest.mark.asyncio
+async def test_export_spotify_data_uses_snapshot_cache(mock_export_spotify, tmp_path):
+    await export_spotify_data(mock_export_spotify, {}, str(tmp_path / 'first.json'))
+    mock_export_spotify.playlist_tracks.reset_mock()
+
+    await export_spotify_data(mock_export_spotify, {}, str(tmp_path / 'second.json'))
+
+    mock_export_spotify.playlist_tracks.assert_not_called()
+    first = load_backup(str(tmp_path / 'first.json'))
+    second = load_backup(str(tmp_path / 'second.json'))
+    assert second['playlists'] == first['playlists']
@@ -5,7 +5,7 @@ import datetime
 import sqlalchemy
 from sqlalchemy import create_engine, select
 from unittest import mock
-from spotify_to_tidal.cache import MatchFailureDatabase, TrackMatchCache
+from spotify_to_tidal.cache import FavoriteIdsCache, MatchFailureDatabase, PlaylistSnapshotCache, TrackMatchCache
 
 
 # Setup an in-memory SQLite database for testing
@@ -67,14 +67,62 @@ def test_remove_match_failure(in_memory_db, mocker):
 
 
 # Test TrackMatchCache
-def test_track_match_cache_insert():
+def test_track_match_cache_insert(restore_track_match_cache):
     track_cache = TrackMatchCache()
     track_cache.insert(("spotify_id", 123))
     assert track_cache.get("spotify_id") == 123
 
 
-def test_track_match_cache_get():
+def test_track_match_cache_get(restore_track_match_cache):
     track_cache = TrackMatchCache()
     track_cache.insert(("spotify_id", 123))
     assert track_cache.get("spotify_id") == 123
-    assert track_cache.get("nonexistent_id") is None
\ No newline at end of file
+    assert track_cache.get("nonexistent_id") is None
+
+def test_track_match_cache_insert_many(restore_track_match_cache):
+    track_cache = TrackMatchCache()
+    track_cache.insert_many({"spotify_id1": 123, "spotify_id2": 456})
+    assert track_cache.get("spotify_id1") == 123
+    assert track_cache.get("spotify_id2") == 456
+
+
+# Test FavoriteIdsCache
+def test_favorite_ids_cache_round_trip(tmp_path):
+    favorites_cache = FavoriteIdsCache(filename=str(tmp_path / "favorites.json"))
+    assert favorites_cache.get("user1", "albums") is None
+
+    favorites_cache.set("user1", "albums", {1, 2})
+    favorites_cache.add("user1", "albums", [3])
+
+    assert favorites_cache.get("user1", "albums") == {1, 2, 3}
+    assert favorites_cache.get("user1", "artists") is None
+
+
+def test_favorite_ids_cache_expires(tmp_path):
+    favorites_cache = FavoriteIdsCache(filename=str(tmp_path / "favorites.json"), max_age=datetime.timedelta(0))
+    favorites_cache.set("user1", "albums", {1, 2})
+
+    assert favorites_cache.get("user1", "albums") is None
+
+
+def test_caches_default_to_xdg_cache_home(tmp_path, monkeypatch):
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+    FavoriteIdsCache().set("user1", "albums", {1})
+
+    assert (tmp_path / "spotify_to_tidal" / "favorite_ids.json").exists()
+    assert PlaylistSnapshotCache().directory == str(tmp_path / "spotify_to_tidal" / "playlist_snapshots")
+
+
+# Test PlaylistSnapshotCache
+def test_playlist_snapshot_cache_matches_key(tmp_path):
+    snapshot_cache = PlaylistSnapshotCache(directory=str(tmp_path))
+    snapshot_cache.set("playlist1", "2:snapshot1", b'[{"id":"track1"}]')
+    snapshot_cache.set("playlist2", "2:snapshot1", b'[]')
+
+    assert snapshot_cache.get("playlist1", "2:snapshot1") == b'[{"id":"track1"}]'
+    assert snapshot_cache.get("playlist1", "2:snapshot2") is None
+    assert snapshot_cache.get("playlist1", "3:snapshot1") is None
+
+    snapshot_cache.prune(["playlist2"])
+    assert snapshot_cache.get("playlist1", "2:snapshot1") is None
+    assert snapshot_cache.get("playlist2", "2:snapshot1") == b'[]'
@@ -3,7 +3,10 @@
 import pytest
 from unittest.mock import MagicMock, AsyncMock, patch
 import asyncio
+import threading
+import tidalapi
 
+from spotify_to_tidal import sync
 from spotify_to_tidal.sync import (
     get_albums_from_spotify,
     get_artists_from_spotify,
@@ -12,6 +15,9 @@ from spotify_to_tidal.sync import (
     simple,
     normalize,
     check_album_similarity,
+    search_new_tracks_on_tidal,
+    search_tidal_concurrently,
+    repeat_on_request_error,
 )
 
 
@@ -307,3 +313,87 @@ async def test_sync_artists_handles_not_found(mocker):
     # Verify artist was NOT added and file was written
     mock_tidal.user.favorites.add_artist.assert_not_called()
     mock_file.assert_called_with("artists not found.txt", "a", encoding="utf-8")
+
+
+# Test search_new_tracks_on_tidal()
+@pytest.mark.asyncio
+async def test_search_new_tracks_on_tidal_shares_concurrent_searches(mocker, restore_track_match_cache):
+    searched_ids = []
+
+    async def _fake_search(spotify_track, semaphore, tidal_session):
+        searched_ids.append(spotify_track['id'])
+        await asyncio.sleep(0)
+        return MagicMock(id=int(spotify_track['id'].removeprefix('shared')))
+
+    mocker.patch('spotify_to_tidal.sync.tidal_search', side_effect=_fake_search)
+    mocker.patch('builtins.open', mocker.mock_open())
+    first = [{'id': 'shared1', 'name': 'One', 'artists': []}, {'id': 'shared2', 'name': 'Two', 'artists': []}]
+    second = [{'id': 'shared2', 'name': 'Two', 'artists': []}, {'id': 'shared3', 'name': 'Three', 'artists': []}]
+
+    await asyncio.gather(
+        search_new_tracks_on_tidal(MagicMock(), first, 'First', {}),
+        search_new_tracks_on_tidal(MagicMock(), second, 'Second', {}),
+    )
+
+    assert sorted(searched_ids) == ['shared1', 'shared2', 'shared3']
+
+
+@pytest.mark.asyncio
+async def test_search_new_tracks_on_tidal_uses_shared_rate_limiter(mocker, restore_track_match_cache):
+    fake_search = mocker.patch('spotify_to_tidal.sync.tidal_search', new_callable=AsyncMock, return_value=MagicMock(id=1))
+    mocker.patch('builtins.open', mocker.mock_open())
+    rate_limiter = asyncio.Semaphore(1)
+
+    await search_new_tracks_on_tidal(MagicMock(), [{'id': 'limited1', 'name': 'One', 'artists': []}], 'Limited', {}, rate_limiter)
+
+    assert fake_search.call_args.args[1] is rate_limiter
+
+
+# Test configure_tidal_pool()
+@pytest.mark.asyncio
+async def test_configure_tidal_pool_sizes_shared_pool():
+    sync.configure_tidal_pool({'tidal_threads': 3})
+    try:
+        assert sync._TIDAL_POOL._max_workers == 3
+        thread_name = await sync._tidal_call(lambda: threading.current_thread().name)
+        assert thread_name.startswith('tidal')
+    finally:
+        sync.configure_tidal_pool({})
+
+
+# Test repeat_on_request_error()
+@pytest.mark.asyncio
+async def test_repeat_on_request_error_reports_abort_on_stderr(mocker, capsys):
+    mocker.patch('spotify_to_tidal.sync.time.sleep')
+    failing_call = AsyncMock(side_effect=tidalapi.exceptions.TooManyRequests())
+
+    with pytest.raises(SystemExit):
+        await repeat_on_request_error(failing_call, remaining=1)
+
+    captured = capsys.readouterr()
+    assert "retrying 1 times" in captured.err
+    assert "Aborting sync" in captured.err
+    assert captured.out == ''
+
+
+# Test search_tidal_concurrently()
+@pytest.mark.asyncio
+async def test_search_tidal_concurrently_searches_repeated_queries_once():
+    mock_tidal = MagicMock()
+    mock_tidal.search.side_effect = lambda query, models: {'query': query}
+
+    results = await search_tidal_concurrently(mock_tidal, ['a', 'b', 'a'], [], {}, desc="Searching")
+
+    assert results == [{'query': 'a'}, {'query': 'b'}, {'query': 'a'}]
+    assert mock_tidal.search.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_search_tidal_concurrently_retries_rate_limited_searches(mocker):
+    mocker.patch('spotify_to_tidal.sync.time.sleep')
+    mock_tidal = MagicMock()
+    mock_tidal.search.side_effect = [tidalapi.exceptions.TooManyRequests(), {'query': 'a'}]
+
+    results = await search_tidal_concurrently(mock_tidal, ['a'], [], {}, desc="Searching")
+
+    assert results == [{'query': 'a'}]